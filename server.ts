@@ -59,9 +59,16 @@ const DATA_DIR = process.env.BUNDO_DATA_DIR || join(process.cwd(), "data");
 const TASKS_PATH = join(DATA_DIR, "tasks.json");
 const PROJECTS_PATH = join(DATA_DIR, "projects.json");
 const STATIC_DIR = join(PKG_DIR, "static");
+// Task writes are coalesced: bursts of edits share a single file rewrite
+const SAVE_DELAY_MS = 200;
+// Failed writes are retried with doubling delays up to this cap
+const SAVE_RETRY_MAX_MS = 30_000;
 
 const PRIORITY_LABELS = ["P0", "P1", "P2", "P3"] as const;
-const PRIORITY_ORDER: Record<string, number> = { P0: 0, P1: 1, P2: 2, P3: 3 };
+const PRIORITY_SET: ReadonlySet<string> = new Set(PRIORITY_LABELS);
+// Every ingest path (load, create, update) validates priority with
+// isPriority, so lookups never miss and need no fallback rank.
+const PRIORITY_ORDER: Record<Task["priority"], number> = { P0: 0, P1: 1, P2: 2, P3: 3 };
 const TASK_TYPES = ["task", "deadline", "reminder", "payment"] as const;
 const CURRENCIES = ["CHF", "USD", "EUR", "BRL"];
 const RECURRENCE_TYPES = ["weekly", "monthly", "yearly"];
@@ -85,6 +92,10 @@ function validateIds(raw: unknown): string[] | null {
   return raw;
 }
 
+function isPriority(raw: unknown): raw is Task["priority"] {
+  return PRIORITY_SET.has(raw as string);
+}
+
 function validCurrency(raw: unknown): string {
   return CURRENCIES.includes(raw as string) ? (raw as string) : "CHF";
 }
@@ -100,10 +111,7 @@ async function parseJson(req: Request): Promise<any> {
   try {
     return await req.json();
   } catch {
-    throw new Response(JSON.stringify({ detail: "Invalid JSON" }), {
-      status: 400,
-      headers: { "Content-Type": "application/json" },
-    });
+    throw Response.json({ detail: "Invalid JSON" }, { status: 400 });
   }
 }
 
@@ -129,14 +137,15 @@ function today(): string {
   return new Date().toISOString().slice(0, 10);
 }
 
-function isoToDate(value: string | null | undefined): string {
-  if (!value) return today();
+// `fallback` lets bulk callers read the clock once instead of per item
+function isoToDate(value: string | null | undefined, fallback?: string): string {
+  if (!value) return fallback ?? today();
   if (/^\d{4}-\d{2}-\d{2}$/.test(value)) {
     const [y, m, d] = value.split("-").map(Number);
     const date = new Date(y, m - 1, d);
     if (!isNaN(date.getTime())) return value;
   }
-  return today();
+  return fallback ?? today();
 }
 
 function daysInMonth(year: number, month: number): number {
@@ -202,18 +211,28 @@ function formatDate(d: Date): string {
 
 let tasks: Task[] = [];
 let projects: Project[] = [];
+// Bumped on every task mutation (see saveTasks); keys caches derived from tasks
+let tasksVersion = 0;
+// id → task lookup; kept in sync wherever tasks are added or removed
+const taskById = new Map<string, Task>();
 
 function parseTasks(raw: unknown): Task[] {
   if (!Array.isArray(raw)) return [];
-  return raw
-    .filter((item: unknown) => typeof item === "object" && item !== null)
-    .map((item: Record<string, unknown>) => ({
-      id: (item.id as string) || crypto.randomUUID(),
+  // Single pass: skip non-objects and normalize the rest, no interim array
+  const parsed: Task[] = [];
+  const todayStr = today();
+  // Ids must be unique for taskById; a hand-edited file may repeat one
+  const seen = new Set<string>();
+  for (const item of raw as Record<string, unknown>[]) {
+    if (typeof item !== "object" || item === null) continue;
+    let id = item.id as string;
+    if (!id || seen.has(id)) id = crypto.randomUUID();
+    seen.add(id);
+    parsed.push({
+      id,
       title: String(item.title ?? "").trim() || "Untitled task",
-      date: isoToDate(item.date as string),
-      priority: PRIORITY_LABELS.includes(item.priority as Task["priority"])
-        ? (item.priority as Task["priority"])
-        : "P2",
+      date: isoToDate(item.date as string, todayStr),
+      priority: isPriority(item.priority) ? item.priority : "P2",
       notes: String(item.notes ?? "").trim(),
       done: Boolean(item.done),
       type: TASK_TYPES.includes(item.type as Task["type"])
@@ -224,7 +243,9 @@ function parseTasks(raw: unknown): Task[] {
       sort_order: (item.sort_order as number) ?? 0,
       amount: String(item.amount ?? "").trim(),
       currency: validCurrency(item.currency),
-    }));
+    });
+  }
+  return parsed;
 }
 
 function loadTasksFromDisk(): Task[] {
@@ -249,10 +270,42 @@ function loadProjectsFromDisk(): Project[] {
   }
 }
 
+let tasksDirty = false;
+let saveTimer: ReturnType<typeof setTimeout> | null = null;
+let saveRetryMs = SAVE_DELAY_MS;
+// Last content written to TASKS_PATH; edits that net out to no change
+// (e.g. toggling a task twice) skip the rewrite
+let lastSavedTasks: string | null = null;
+
 function saveTasks(): void {
-  const tmp = TASKS_PATH + ".tmp";
-  writeFileSync(tmp, JSON.stringify(tasks, null, 2));
-  renameSync(tmp, TASKS_PATH);
+  tasksVersion++;
+  tasksDirty = true;
+  if (!saveTimer) saveTimer = setTimeout(flushTasks, SAVE_DELAY_MS);
+}
+
+function flushTasks(): void {
+  if (saveTimer) {
+    clearTimeout(saveTimer);
+    saveTimer = null;
+  }
+  if (!tasksDirty) return;
+  tasksDirty = false;
+  const data = JSON.stringify(tasks, null, 2);
+  if (data === lastSavedTasks) return;
+  try {
+    const tmp = TASKS_PATH + ".tmp";
+    writeFileSync(tmp, data);
+    renameSync(tmp, TASKS_PATH);
+    lastSavedTasks = data;
+    saveRetryMs = SAVE_DELAY_MS;
+  } catch (e) {
+    // Keep the data dirty and schedule a retry, backing off while the
+    // failure persists, so unsaved edits don't wait for the next change
+    tasksDirty = true;
+    console.error(`[bun-do] failed to save tasks (retrying in ${saveRetryMs} ms): ${e instanceof Error ? e.message : e}`);
+    saveTimer = setTimeout(flushTasks, saveRetryMs);
+    saveRetryMs = Math.min(saveRetryMs * 2, SAVE_RETRY_MAX_MS);
+  }
 }
 
 function saveProjects(): void {
@@ -261,8 +314,18 @@ function saveProjects(): void {
   renameSync(tmp, PROJECTS_PATH);
 }
 
+function indexTasks(): void {
+  taskById.clear();
+  for (const t of tasks) taskById.set(t.id, t);
+}
+
+function addTask(task: Task): void {
+  tasks.push(task);
+  taskById.set(task.id, task);
+}
+
 function findTask(id: string): Task | undefined {
-  return tasks.find((t) => t.id === id);
+  return taskById.get(id);
 }
 
 function findProject(id: string): Project | undefined {
@@ -295,40 +358,66 @@ function createNextRecurring(task: Task): Task {
   };
 }
 
+// Day + tasksVersion of the last completed sweep. Nothing can become overdue
+// until the date rolls over or a task changes, so repeat GETs skip the scan.
+let carriedOverAt = "";
+
 function carryOver(todayStr: string): number {
+  if (carriedOverAt === `${todayStr}#${tasksVersion}`) return 0;
   let moved = 0;
-  for (const task of tasks) {
+  // Date-ordered, so only the overdue prefix is visited
+  for (const task of sortedTasks()) {
+    if (task.date >= todayStr) break;
     if (task.done) continue;
     if (task.recurrence) continue;
     if (task.type === "payment") continue;
-    if (task.date < todayStr) {
-      task.date = todayStr;
-      moved++;
-    }
+    task.date = todayStr;
+    moved++;
   }
   if (moved) saveTasks();
+  carriedOverAt = `${todayStr}#${tasksVersion}`;
   return moved;
 }
 
+// Shared collator: same ordering as localeCompare, set up once
+const TITLE_COLLATOR = new Intl.Collator();
+
 function sortTasks(list: Task[]): Task[] {
-  return [...list].sort((a, b) => {
-    if (a.date !== b.date) return a.date < b.date ? -1 : 1;
-    const pa = PRIORITY_ORDER[a.priority] ?? 99;
-    const pb = PRIORITY_ORDER[b.priority] ?? 99;
-    if (pa !== pb) return pa - pb;
-    return a.title.toLowerCase().localeCompare(b.title.toLowerCase());
+  // Decorate once so the comparator never lowercases or looks up ranks
+  const keyed = list.map((task) => ({ task, prio: PRIORITY_ORDER[task.priority], title: task.title.toLowerCase() }));
+  keyed.sort((a, b) => {
+    if (a.task.date !== b.task.date) return a.task.date < b.task.date ? -1 : 1;
+    if (a.prio !== b.prio) return a.prio - b.prio;
+    return TITLE_COLLATOR.compare(a.title, b.title);
   });
+  return keyed.map((k) => k.task);
+}
+
+let sortedCache: { version: number; list: Task[] } | null = null;
+
+function sortedTasks(): Task[] {
+  if (!sortedCache || sortedCache.version !== tasksVersion) {
+    sortedCache = { version: tasksVersion, list: sortTasks(tasks) };
+  }
+  return sortedCache.list;
 }
 
 // ---------------------------------------------------------------------------
 // Response helpers
 // ---------------------------------------------------------------------------
 
+// Response.json serializes natively in Bun, skipping the intermediate JS string
 function json(data: unknown, status = 200): Response {
-  return new Response(JSON.stringify(data), {
-    status,
-    headers: { "Content-Type": "application/json" },
-  });
+  return Response.json(data, { status });
+}
+
+// Static assets revalidate on every load (no-cache) but are only re-sent
+// when their size or mtime changed, so upgrades still show up immediately
+function staticFile(req: Request, file: ReturnType<typeof Bun.file>, contentType: string): Response {
+  const etag = `W/"${file.size.toString(36)}-${file.lastModified.toString(36)}"`;
+  const headers = { "Content-Type": contentType, "Cache-Control": "no-cache", ETag: etag };
+  if (req.headers.get("if-none-match") === etag) return new Response(null, { status: 304, headers });
+  return new Response(file, { headers });
 }
 
 function notFound(detail: string): Response {
@@ -341,9 +430,24 @@ function notFound(detail: string): Response {
 
 // -- Tasks --
 
-function handleGetTasks(): Response {
+// Serialized GET /api/tasks body; polling clients mostly re-read an unchanged
+// list, so it is only re-stringified after tasksVersion moves
+let tasksBodyCache: { version: number; body: string } | null = null;
+
+// tasksVersion restarts at 0 with the process, so tags also carry a boot id
+const BOOT_ID = Date.now().toString(36);
+
+function handleGetTasks(req: Request): Response {
   const moved = carryOver(today());
-  return json({ tasks: sortTasks(tasks), carried_over: moved });
+  if (moved) return json({ tasks: sortedTasks(), carried_over: moved });
+  const etag = `"${BOOT_ID}-${tasksVersion}"`;
+  if (req.headers.get("if-none-match") === etag) return new Response(null, { status: 304, headers: { ETag: etag } });
+  if (!tasksBodyCache || tasksBodyCache.version !== tasksVersion) {
+    tasksBodyCache = { version: tasksVersion, body: JSON.stringify({ tasks: sortedTasks(), carried_over: 0 }) };
+  }
+  return new Response(tasksBodyCache.body, {
+    headers: { "Content-Type": "application/json;charset=utf-8", ETag: etag },
+  });
 }
 
 async function handleCreateTask(req: Request): Promise<Response> {
@@ -352,7 +456,7 @@ async function handleCreateTask(req: Request): Promise<Response> {
     id: crypto.randomUUID(),
     title: String(body.title ?? "").trim() || "Untitled task",
     date: isoToDate(body.date),
-    priority: PRIORITY_LABELS.includes(body.priority) ? body.priority : "P2",
+    priority: isPriority(body.priority) ? body.priority : "P2",
     notes: String(body.notes ?? "").trim(),
     done: false,
     type: TASK_TYPES.includes(body.type) ? body.type : "task",
@@ -362,7 +466,7 @@ async function handleCreateTask(req: Request): Promise<Response> {
     amount: String(body.amount ?? "").trim(),
     currency: validCurrency(body.currency),
   };
-  tasks.push(newTask);
+  addTask(newTask);
   saveTasks();
   return json(newTask);
 }
@@ -371,11 +475,10 @@ async function handleReorderTasks(req: Request): Promise<Response> {
   const body = await parseJson(req);
   const ids = validateIds(body.ids);
   if (!ids) return json({ detail: "ids must be a string array" }, 400);
-  const idToOrder: Record<string, number> = {};
-  ids.forEach((id, i) => (idToOrder[id] = i));
-  for (const task of tasks) {
-    if (task.id in idToOrder) task.sort_order = idToOrder[task.id];
-  }
+  ids.forEach((id, i) => {
+    const task = findTask(id);
+    if (task) task.sort_order = i;
+  });
   saveTasks();
   return json({ ok: true });
 }
@@ -383,6 +486,7 @@ async function handleReorderTasks(req: Request): Promise<Response> {
 function handleClearDone(): Response {
   const before = tasks.length;
   tasks = tasks.filter((t) => !t.done);
+  indexTasks();
   const cleared = before - tasks.length;
   saveTasks();
   return json({ cleared });
@@ -395,7 +499,7 @@ async function handleUpdateTask(taskId: string, req: Request): Promise<Response>
 
   if (body.title !== undefined) task.title = String(body.title).trim() || task.title;
   if (body.date !== undefined) task.date = isoToDate(body.date);
-  if (body.priority !== undefined && PRIORITY_LABELS.includes(body.priority)) task.priority = body.priority;
+  if (body.priority !== undefined && isPriority(body.priority)) task.priority = body.priority;
   if (body.notes !== undefined) task.notes = String(body.notes).trim();
   if (body.type !== undefined && TASK_TYPES.includes(body.type)) task.type = body.type;
   if (body.amount !== undefined) task.amount = String(body.amount).trim();
@@ -405,7 +509,7 @@ async function handleUpdateTask(taskId: string, req: Request): Promise<Response>
     const wasDone = task.done;
     task.done = Boolean(body.done);
     if (body.done && !wasDone && task.recurrence) {
-      tasks.push(createNextRecurring(task));
+      addTask(createNextRecurring(task));
     }
   }
   saveTasks();
@@ -413,9 +517,11 @@ async function handleUpdateTask(taskId: string, req: Request): Promise<Response>
 }
 
 function handleDeleteTask(taskId: string): Response {
-  const before = tasks.length;
-  tasks = tasks.filter((t) => t.id !== taskId);
-  if (tasks.length === before) return notFound("Task not found");
+  const task = findTask(taskId);
+  if (!task) return notFound("Task not found");
+  taskById.delete(taskId);
+  // Splice in place: no list copy, and file order stays stable for diffs
+  tasks.splice(tasks.indexOf(task), 1);
   saveTasks();
   return json({ ok: true });
 }
@@ -466,8 +572,9 @@ async function handleReorderSubtasks(taskId: string, req: Request): Promise<Resp
   if (!task) return notFound("Task not found");
   const byId = new Map(task.subtasks.map((s) => [s.id, s]));
   const reordered = ids.map((id) => byId.get(id)).filter(Boolean) as Subtask[];
+  const listed = new Set(ids);
   for (const s of task.subtasks) {
-    if (!ids.includes(s.id)) reordered.push(s);
+    if (!listed.has(s.id)) reordered.push(s);
   }
   task.subtasks = reordered;
   saveTasks();
@@ -552,7 +659,7 @@ async function handleRequest(req: Request): Promise<Response> {
   if (path === "/" || path === "/index.html") {
     const file = Bun.file(join(STATIC_DIR, "index.html"));
     if (await file.exists()) {
-      return new Response(file, { headers: { "Content-Type": "text/html" } });
+      return staticFile(req, file, "text/html");
     }
     return new Response("Not found", { status: 404 });
   }
@@ -564,7 +671,7 @@ async function handleRequest(req: Request): Promise<Response> {
     const file = Bun.file(resolved);
     if (await file.exists()) {
       const ext = extname(filepath);
-      return new Response(file, { headers: { "Content-Type": MIME[ext] || "application/octet-stream" } });
+      return staticFile(req, file, MIME[ext] || "application/octet-stream");
     }
     return new Response("Not found", { status: 404 });
   }
@@ -580,7 +687,7 @@ async function handleRequest(req: Request): Promise<Response> {
   // -- API routes --
   let match: RegExpMatchArray | null;
 
-  if (path === "/api/tasks" && method === "GET") return handleGetTasks();
+  if (path === "/api/tasks" && method === "GET") return handleGetTasks(req);
   if (path === "/api/tasks" && method === "POST") return handleCreateTask(req);
   if (path === "/api/tasks/reorder" && method === "POST") return handleReorderTasks(req);
   if (path === "/api/tasks/clear-done" && method === "POST") return handleClearDone();
@@ -637,8 +744,14 @@ if (!existsSync(PROJECTS_PATH)) {
 
 // Load data into memory once at startup
 tasks = loadTasksFromDisk();
+indexTasks();
 projects = loadProjectsFromDisk();
 
+// Flush pending task writes on shutdown (`bun-do stop` sends SIGTERM)
+process.on("exit", flushTasks);
+process.on("SIGINT", () => process.exit(130));
+process.on("SIGTERM", () => process.exit(143));
+
 const portArg = Bun.argv.find((a) => a.startsWith("--port="));
 const port = portArg ? parseInt(portArg.split("=")[1]) : 8000;
 